@@ -178,33 +178,55 @@ st.markdown("### 📥 Water Usage Data Input")
 st.markdown('<p style="color: #94a3b8; font-size: 1rem;">Enter daily water consumption for the week (in liters)</p>', unsafe_allow_html=True)
 st.markdown("<br>", unsafe_allow_html=True)
 
-col1, col2, col3 = st.columns([1, 1, 1])
+# Analysed usage survives widget edits so the results stay on screen
+if "usage" not in st.session_state:
+    st.session_state.usage = None
 
-with col1:
-    st.markdown('<h4 style="color: #06b6d4;">📅 Early Week</h4>', unsafe_allow_html=True)
-    mon = st.number_input("🔵 Monday (Liters)", min_value=0, max_value=10000, value=300, step=10)
-    tue = st.number_input("🔵 Tuesday (Liters)", min_value=0, max_value=10000, value=310, step=10)
+# The Analyze button sits outside the fragment, so clicking it reruns the
+# whole page once. Snapshot before the fragment runs so it sees fresh usage.
+if st.session_state.get("analyze"):
+    st.session_state.usage = tuple(st.session_state[k] for k in ("mon", "tue", "wed", "thu", "fri", "sat", "sun"))
+    st.session_state.show_balloons = True
 
-with col2:
-    st.markdown('<h4 style="color: #10b981;">📅 Mid Week</h4>', unsafe_allow_html=True)
-    wed = st.number_input("🟢 Wednesday (Liters)", min_value=0, max_value=10000, value=305, step=10)
-    thu = st.number_input("🟡 Thursday (Liters)", min_value=0, max_value=10000, value=680, step=10)
-    fri = st.number_input("🔴 Friday (Liters)", min_value=0, max_value=10000, value=720, step=10)
+@st.fragment
+def render_inputs():
+    # Runs as a fragment: editing an input reruns only this section
+    col1, col2, col3 = st.columns([1, 1, 1])
+
+    with col1:
+        st.markdown('<h4 style="color: #06b6d4;">📅 Early Week</h4>', unsafe_allow_html=True)
+        mon = st.number_input("🔵 Monday (Liters)", min_value=0, max_value=10000, value=300, step=10, key="mon")
+        tue = st.number_input("🔵 Tuesday (Liters)", min_value=0, max_value=10000, value=310, step=10, key="tue")
 
-with col3:
-    st.markdown('<h4 style="color: #f59e0b;">📅 Weekend</h4>', unsafe_allow_html=True)
-    sat = st.number_input("🟣 Saturday (Liters)", min_value=0, max_value=10000, value=350, step=10)
-    sun = st.number_input("🟠 Sunday (Liters)", min_value=0, max_value=10000, value=330, step=10)
+    with col2:
+        st.markdown('<h4 style="color: #10b981;">📅 Mid Week</h4>', unsafe_allow_html=True)
+        wed = st.number_input("🟢 Wednesday (Liters)", min_value=0, max_value=10000, value=305, step=10, key="wed")
+        thu = st.number_input("🟡 Thursday (Liters)", min_value=0, max_value=10000, value=680, step=10, key="thu")
+        fri = st.number_input("🔴 Friday (Liters)", min_value=0, max_value=10000, value=720, step=10, key="fri")
+
+    with col3:
+        st.markdown('<h4 style="color: #f59e0b;">📅 Weekend</h4>', unsafe_allow_html=True)
+        sat = st.number_input("🟣 Saturday (Liters)", min_value=0, max_value=10000, value=350, step=10, key="sat")
+        sun = st.number_input("🟠 Sunday (Liters)", min_value=0, max_value=10000, value=330, step=10, key="sun")
+
+    # Results below are drawn from the last snapshot, so flag when they're stale
+    usage = (mon, tue, wed, thu, fri, sat, sun)
+    if st.session_state.usage is not None and usage != st.session_state.usage:
+        st.info("ℹ️ Inputs changed since the last analysis. The results below are out of date. Click **ANALYZE WATER USAGE** to refresh them.")
+
+render_inputs()
 
 st.markdown("<br>", unsafe_allow_html=True)
 
 # Center the analyze button
 col1, col2, col3 = st.columns([1, 1, 1])
 with col2:
-    analyze_button = st.button("🚀 ANALYZE WATER USAGE", use_container_width=True)
+    st.button("🚀 ANALYZE WATER USAGE", use_container_width=True, key="analyze")
 
 # ----------------- ANALYSIS -----------------
-if analyze_button:
+def render_results(usage):
+    mon, tue, wed, thu, fri, sat, sun = usage
+
     # Workflow animation
     st.markdown('<div class="workflow-line"></div>', unsafe_allow_html=True)
     
@@ -654,6 +676,10 @@ if analyze_button:
     </div>
     """, unsafe_allow_html=True)
     
-    st.balloons()
+    if st.session_state.pop("show_balloons", False):
+        st.balloons()
+
+if st.session_state.usage is not None:
+    render_results(st.session_state.usage)
 
 # End of app
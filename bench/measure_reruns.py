@@ -0,0 +1,133 @@
+"""Measure rerun latency and websocket payload of a running AquaWise app.
+
+Acts as a minimal Streamlit browser client. Each iteration clicks Analyze,
+then edits the Thursday input. For both actions it records the time from
+sending the rerun request to receiving ``script_finished``, and the bytes of
+the ForwardMsgs sent back. Widgets inside an ``st.fragment`` are rerun with
+their fragment id, the same way the browser does it.
+
+Usage (Streamlit 1.37+, plus ``pip install websocket-client``):
+
+    streamlit run app.py --server.headless true --server.port 8501
+    python bench/measure_reruns.py --port 8501 --runs 50
+
+To compare two commits, check out each one, start the app and run the
+script against it.
+"""
+import argparse
+import statistics
+import time
+
+import websocket
+from streamlit.proto.BackMsg_pb2 import BackMsg
+from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+
+DEFAULT_USAGE = [300, 310, 305, 680, 720, 350, 330]
+DONE = {ForwardMsg.FINISHED_SUCCESSFULLY, ForwardMsg.FINISHED_FRAGMENT_RUN_SUCCESSFULLY}
+
+# Markers for the page sections that should not be resent on an input edit
+SECTIONS = {
+    "css": "<style>",
+    "header": "main-header",
+    "results": "Real-Time Intelligence Dashboard",
+}
+
+
+class Client:
+    def __init__(self, port):
+        self.ws = websocket.create_connection(f"ws://localhost:{port}/_stcore/stream", timeout=30)
+        self.inputs = {}  # number_input id -> fragment id, in page order
+        self.button = None
+        self.button_fragment = ""
+
+    def rerun(self, values, trigger=False, fragment_id=""):
+        msg = BackMsg()
+        state = msg.rerun_script
+        state.SetInParent()
+        for widget_id, value in zip(self.inputs, values):
+            widget = state.widget_states.widgets.add()
+            widget.id = widget_id
+            widget.int_value = value
+        if trigger and self.button:
+            widget = state.widget_states.widgets.add()
+            widget.id = self.button
+            widget.trigger_value = True
+        if fragment_id:
+            state.fragment_id = fragment_id
+
+        start = time.perf_counter()
+        self.ws.send_binary(msg.SerializeToString())
+        total_bytes = delta_bytes = deltas = 0
+        sent = set()
+        while True:
+            raw = self.ws.recv()
+            fwd = ForwardMsg()
+            fwd.ParseFromString(raw)
+            total_bytes += len(raw)
+            kind = fwd.WhichOneof("type")
+            if kind == "delta":
+                delta_bytes += len(raw)
+                deltas += 1
+                self._record(fwd.delta, sent)
+            elif kind == "script_finished" and fwd.script_finished in DONE:
+                return {
+                    "ms": (time.perf_counter() - start) * 1000,
+                    "bytes": total_bytes,
+                    "delta_bytes": delta_bytes,
+                    "deltas": deltas,
+                    "sent": sorted(sent),
+                }
+
+    def _record(self, delta, sent):
+        element = delta.new_element
+        kind = element.WhichOneof("type")
+        if kind == "number_input" and element.number_input.id not in self.inputs:
+            self.inputs[element.number_input.id] = delta.fragment_id
+        elif kind == "button":
+            self.button = element.button.id
+            self.button_fragment = delta.fragment_id
+        elif kind == "markdown":
+            for name, marker in SECTIONS.items():
+                if marker in element.markdown.body:
+                    sent.add(name)
+
+    def analyze(self):
+        return self.rerun(DEFAULT_USAGE, trigger=True, fragment_id=self.button_fragment)
+
+    def edit_thursday(self, value):
+        values = list(DEFAULT_USAGE)
+        values[3] = value
+        return self.rerun(values, fragment_id=list(self.inputs.values())[3])
+
+
+def summarize(name, results):
+    latencies = sorted(r["ms"] for r in results)
+    last = results[-1]
+    print(
+        f"{name:8} median {statistics.median(latencies):6.1f} ms  "
+        f"p90 {latencies[int(len(latencies) * 0.9)]:6.1f} ms  "
+        f"{last['bytes']:6d} B  {last['deltas']:3d} deltas  "
+        f"resent: {', '.join(last['sent']) or 'none'}"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--port", type=int, default=8501)
+    parser.add_argument("--runs", type=int, default=50)
+    args = parser.parse_args()
+
+    client = Client(args.port)
+    client.rerun([])  # initial page load
+    analyses, edits = [], []
+    for i in range(args.runs):
+        analyses.append(client.analyze())
+        edits.append(client.edit_thursday(690 + i))
+
+    print(f"runs: {args.runs}  fragment ids: {sorted(set(client.inputs.values()) - {''}) or 'none'}")
+    summarize("analyze", analyses)
+    summarize("edit", edits)
+
+
+if __name__ == "__main__":
+    main()